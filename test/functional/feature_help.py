@@ -10,50 +10,56 @@ from test_framework.util import assert_equal
 class HelpTest(BitcoinTestFramework):
     def set_test_params(self):
         self.setup_clean_chain = True
-        self.num_nodes = 1
+        # One node per invocation, so that they can all run at the same time
+        self.num_nodes = 3
 
     def setup_network(self):
         self.add_nodes(self.num_nodes)
         # Don't start the node
 
-    def get_node_output(self, *, ret_code_expected):
-        ret_code = self.nodes[0].process.wait(timeout=60)
+    def get_node_output(self, node, *, ret_code_expected):
+        ret_code = node.process.wait(timeout=60)
         assert_equal(ret_code, ret_code_expected)
-        self.nodes[0].stdout.seek(0)
-        self.nodes[0].stderr.seek(0)
-        out = self.nodes[0].stdout.read()
-        err = self.nodes[0].stderr.read()
-        self.nodes[0].stdout.close()
-        self.nodes[0].stderr.close()
+        node.stdout.seek(0)
+        node.stderr.seek(0)
+        out = node.stdout.read()
+        err = node.stderr.read()
+        node.stdout.close()
+        node.stderr.close()
 
         # Clean up TestNode state
-        self.nodes[0].running = False
-        self.nodes[0].process = None
-        self.nodes[0].rpc_connected = False
-        self.nodes[0].rpc = None
+        node.running = False
+        node.process = None
+        node.rpc_connected = False
+        node.rpc = None
 
         return out, err
 
     def run_test(self):
+        help_node, version_node, fakearg_node = self.nodes
+
+        # Each node exits right after parsing its arguments, so start them all
+        # before waiting on any of them.
         self.log.info("Start bitcoin with -h for help text")
-        self.nodes[0].start(extra_args=['-h'])
+        help_node.start(extra_args=['-h'])
+        self.log.info("Start bitcoin with -version for version information")
+        version_node.start(extra_args=['-version'])
+        # Test that arguments not in the help results in an error
+        self.log.info("Start bitcoind with -fakearg to make sure it does not start")
+        fakearg_node.start(extra_args=['-fakearg'])
+
         # Node should exit immediately and output help to stdout.
-        output, _ = self.get_node_output(ret_code_expected=0)
+        output, _ = self.get_node_output(help_node, ret_code_expected=0)
         assert b'Options' in output
         self.log.info("Help text received: {} (...)".format(output[0:60]))
 
-        self.log.info("Start bitcoin with -version for version information")
-        self.nodes[0].start(extra_args=['-version'])
         # Node should exit immediately and output version to stdout.
-        output, _ = self.get_node_output(ret_code_expected=0)
+        output, _ = self.get_node_output(version_node, ret_code_expected=0)
         assert b'version' in output
         self.log.info("Version text received: {} (...)".format(output[0:60]))
 
-        # Test that arguments not in the help results in an error
-        self.log.info("Start bitcoind with -fakearg to make sure it does not start")
-        self.nodes[0].start(extra_args=['-fakearg'])
         # Node should exit immediately and output an error to stderr
-        _, output = self.get_node_output(ret_code_expected=1)
+        _, output = self.get_node_output(fakearg_node, ret_code_expected=1)
         assert b'Error parsing command line arguments' in output
         self.log.info("Error message received: {} (...)".format(output[0:60]))
 
@@ -81,8 +81,13 @@ class AddrTest(BitcoinTestFramework):
         # pop m_next_addr_send timer
         self.mocktime += 5 * 60
         self.nodes[0].setmocktime(self.mocktime)
-        for peer in receivers:
-            peer.sync_send_with_ping()
+        # Same as calling sync_send_with_ping() on every receiver, but send each
+        # round of pings to all of them before waiting for any of the pongs
+        for _ in range(2):
+            for peer in receivers:
+                peer.send_ping()
+            for peer in receivers:
+                peer.wait_for_pong()
 
     def oversized_addr_test(self):
         self.log.info('Send an addr message that is too large')
@@ -13,24 +13,27 @@ the same local address. See Issue #14210 for more info.
 Therefore, this test is limited to the remaining protection criteria.
 """
 
-import time
+import heapq
+from operator import itemgetter
 
 from test_framework.blocktools import create_block, create_coinbase
-from test_framework.messages import CTransaction, FromHex, msg_pong, msg_tx
-from test_framework.p2p import P2PDataStore, P2PInterface
+from test_framework.messages import msg_pong, msg_tx, tx_from_hex
+from test_framework.p2p import NetworkThread, P2PDataStore, P2PInterface
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import assert_equal
 
 
+def send_slow_pong(peer, ping):
+    # Delay the pong without blocking the network thread, which is shared by all peers
+    NetworkThread.network_event_loop.call_later(0.1, peer.send_message, msg_pong(ping.nonce))
+
 class SlowP2PDataStore(P2PDataStore):
     def on_ping(self, message):
-        time.sleep(0.1)
-        self.send_message(msg_pong(message.nonce))
+        send_slow_pong(self, message)
 
 class SlowP2PInterface(P2PInterface):
     def on_ping(self, message):
-        time.sleep(0.1)
-        self.send_message(msg_pong(message.nonce))
+        send_slow_pong(self, message)
 
 class P2PEvict(BitcoinTestFramework):
     def set_test_params(self):
@@ -45,18 +48,24 @@ class P2PEvict(BitcoinTestFramework):
         protected_peers = set()  # peers that we expect to be protected from eviction
         current_peer = -1
         node = self.nodes[0]
-        node.generatetoaddress(101, node.get_deterministic_priv_key().address)
+        address, privkey = node.get_deterministic_priv_key()
+        node.generatetoaddress(101, address)
 
         self.log.info("Create 4 peers and protect them from eviction by sending us a block")
+        # Build the chain of 4 blocks (one per peer) on top of the tip up front
+        best_block = node.getblock(node.getbestblockhash())
+        tip, height, block_time = int(best_block['hash'], 16), best_block['height'], best_block['time']
+        blocks = []
         for _ in range(4):
+            height += 1
+            block_time += 1
+            block = create_block(tip, create_coinbase(height), block_time)
+            block.solve()
+            blocks.append(block)
+            tip = block.sha256
+        for block in blocks:
             block_peer = node.add_p2p_connection(SlowP2PDataStore())
             current_peer += 1
-            block_peer.sync_with_ping()
-            best_block = node.getbestblockhash()
-            tip = int(best_block, 16)
-            best_block_time = node.getblock(best_block)['time']
-            block = create_block(tip, create_coinbase(node.getblockcount() + 1), best_block_time + 1)
-            block.solve()
             block_peer.send_blocks_and_test([block], node, success=True)
             protected_peers.add(current_peer)
 
@@ -66,26 +75,28 @@ class P2PEvict(BitcoinTestFramework):
             current_peer += 1
 
         self.log.info("Create 4 peers and protect them from eviction by sending us a tx")
-        for i in range(4):
+        # Build and sign the 4 txs up front, batching each round of RPC calls
+        # into a single request
+        blockhashes = node.batch_results([node.getblockhash.get_request(i + 1) for i in range(4)])
+        prevblocks = node.batch_results([node.getblock.get_request(h, 2) for h in blockhashes])
+        prevtxs = [b['tx'][0] for b in prevblocks]
+        rawtxs = node.batch_results([node.createrawtransaction.get_request(
+            inputs=[{'txid': prevtx['txid'], 'vout': 0}],
+            outputs=[{address: 50 - 0.00125}],
+        ) for prevtx in prevtxs])
+        sigtxs = node.batch_results([node.signrawtransactionwithkey.get_request(
+            hexstring=rawtx,
+            privkeys=[privkey],
+            prevtxs=[{
+                'txid': prevtx['txid'],
+                'vout': 0,
+                'scriptPubKey': prevtx['vout'][0]['scriptPubKey']['hex'],
+            }],
+        ) for rawtx, prevtx in zip(rawtxs, prevtxs)])
+        for sigtx in sigtxs:
             txpeer = node.add_p2p_connection(SlowP2PInterface())
             current_peer += 1
-            txpeer.sync_with_ping()
-
-            prevtx = node.getblock(node.getblockhash(i + 1), 2)['tx'][0]
-            rawtx = node.createrawtransaction(
-                inputs=[{'txid': prevtx['txid'], 'vout': 0}],
-                outputs=[{node.get_deterministic_priv_key().address: 50 - 0.00125}],
-            )
-            sigtx = node.signrawtransactionwithkey(
-                hexstring=rawtx,
-                privkeys=[node.get_deterministic_priv_key().key],
-                prevtxs=[{
-                    'txid': prevtx['txid'],
-                    'vout': 0,
-                    'scriptPubKey': prevtx['vout'][0]['scriptPubKey']['hex'],
-                }],
-            )['hex']
-            txpeer.send_message(msg_tx(FromHex(CTransaction(), sigtx)))
+            txpeer.send_message(msg_tx(tx_from_hex(sigtx['hex'])))
             protected_peers.add(current_peer)
 
         self.log.info("Create 8 peers and protect them from eviction by having faster pings")
@@ -96,15 +107,12 @@ class P2PEvict(BitcoinTestFramework):
 
         # Make sure by asking the node what the actual min pings are
         peerinfo = node.getpeerinfo()
-        pings = {}
-        for i in range(len(peerinfo)):
-            pings[i] = peerinfo[i]['minping'] if 'minping' in peerinfo[i] else 1000000
-        sorted_pings = sorted(pings.items(), key=lambda x: x[1])
+        pings = (peer.get('minping', 1000000) for peer in peerinfo)
+        fastest_pings = heapq.nsmallest(8, enumerate(pings), key=itemgetter(1))
 
         # Usually the 8 fast peers are protected. In rare case of unreliable pings,
         # one of the slower peers might have a faster min ping though.
-        for i in range(8):
-            protected_peers.add(sorted_pings[i][0])
+        protected_peers.update(i for i, _ in fastest_pings)
 
         self.log.info("Create peer that triggers the eviction mechanism")
         node.add_p2p_connection(SlowP2PInterface())
@@ -112,10 +120,7 @@ class P2PEvict(BitcoinTestFramework):
         # One of the non-protected peers must be evicted. We can't be sure which one because
         # 4 peers are protected via netgroup, which is identical for all peers,
         # and the eviction mechanism doesn't preserve the order of identical elements.
-        evicted_peers = []
-        for i in range(len(node.p2ps)):
-            if not node.p2ps[i].is_connected:
-                evicted_peers.append(i)
+        evicted_peers = [i for i, peer in enumerate(node.p2ps) if not peer.is_connected]
 
         self.log.info("Test that one peer was evicted")
         self.log.debug("{} evicted peer: {}".format(len(evicted_peers), set(evicted_peers)))
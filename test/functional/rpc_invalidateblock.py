@@ -19,6 +19,12 @@ class InvalidateTest(BitcoinTestFramework):
     def setup_network(self):
         self.setup_nodes()
 
+    def wait_for_height(self, node, height):
+        # Time out on the node side, well before the RPC connection does, so
+        # that a missing reorg fails with a clear message
+        timeout_ms = min(self.rpc_timeout * 1000 // 2, 0x7fffffff)
+        assert_equal(node.waitforblockheight(height=height, timeout=timeout_ms)['height'], height)
+
     def run_test(self):
         self.log.info("Make sure we repopulate setBlockIndexCandidates after InvalidateBlock:")
         self.log.info("Mine 4 blocks on Node 0")
@@ -32,8 +38,8 @@ class InvalidateTest(BitcoinTestFramework):
 
         self.log.info("Connect nodes to force a reorg")
         self.connect_nodes(0, 1)
-        self.sync_blocks(self.nodes[0:2])
-        assert_equal(self.nodes[0].getblockcount(), 6)
+        self.wait_for_height(self.nodes[0], 6)
+        assert_equal(self.nodes[0].getbestblockhash(), self.nodes[1].getbestblockhash())
         badhash = self.nodes[1].getblockhash(2)
 
         self.log.info("Invalidate block 2 on node 0 and verify we reorg to node 0's original chain")
@@ -44,8 +50,8 @@ class InvalidateTest(BitcoinTestFramework):
         self.log.info("Make sure we won't reorg to a lower work chain:")
         self.connect_nodes(1, 2)
         self.log.info("Sync node 2 to node 1 so both have 6 blocks")
-        self.sync_blocks(self.nodes[1:3])
-        assert_equal(self.nodes[2].getblockcount(), 6)
+        self.wait_for_height(self.nodes[2], 6)
+        assert_equal(self.nodes[2].getbestblockhash(), self.nodes[1].getbestblockhash())
         self.log.info("Invalidate block 5 on node 1 so its tip is now at 4")
         self.nodes[1].invalidateblock(self.nodes[1].getblockhash(5))
         assert_equal(self.nodes[1].getblockcount(), 4)
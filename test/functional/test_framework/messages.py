@@ -195,6 +195,12 @@ def FromHex(obj, hex_string):
     obj.deserialize(BytesIO(hex_str_to_bytes(hex_string)))
     return obj
 
+# Deserialize a transaction from a hex string representation (eg from RPC)
+def tx_from_hex(hex_string):
+    tx = CTransaction()
+    tx.deserialize(BytesIO(bytes.fromhex(hex_string)))
+    return tx
+
 # Convert a binary-serializable object to hex (eg for submission via RPC)
 def ToHex(obj):
     return obj.serialize().hex()
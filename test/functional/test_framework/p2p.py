@@ -21,7 +21,7 @@ P2PTxInvStore: A p2p interface class that inherits from P2PDataStore, and keeps
               a count of how many times each txid has been announced."""
 
 import asyncio
-from collections import defaultdict
+from collections import Counter, defaultdict
 from io import BytesIO
 import logging
 import struct
@@ -549,8 +549,15 @@ class P2PInterface(P2PConnection):
 
     def sync_with_ping(self, timeout=60):
         """Ensure ProcessMessages is called on this connection"""
+        self.send_ping()
+        self.wait_for_pong(timeout=timeout)
+
+    def send_ping(self):
+        """Send a ping whose pong is awaited by wait_for_pong()"""
         self.send_message(msg_ping(nonce=self.ping_counter))
 
+    def wait_for_pong(self, timeout=60):
+        """Wait for the pong matching the last ping sent with send_ping()"""
         def test_function():
             return self.last_message.get("pong") and self.last_message["pong"].nonce == self.ping_counter
 
@@ -766,15 +773,12 @@ class P2PTxInvStore(P2PInterface):
     """A P2PInterface which stores a count of how many times each txid has been announced."""
     def __init__(self):
         super().__init__()
-        self.tx_invs_received = defaultdict(int)
+        self.tx_invs_received = Counter()
 
     def on_inv(self, message):
         super().on_inv(message) # Send getdata in response.
         # Store how many times invs have been received for each tx.
-        for i in message.inv:
-            if (i.type == MSG_TX) or (i.type == MSG_WTX):
-                # save txid
-                self.tx_invs_received[i.hash] += 1
+        self.tx_invs_received.update(i.hash for i in message.inv if i.type in (MSG_TX, MSG_WTX))
 
     def get_invs(self):
         with p2p_lock:
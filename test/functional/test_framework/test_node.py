@@ -301,6 +301,19 @@ class TestNode():
         self.log.debug("TestNode.generate() dispatches `generate` call to `generatetoaddress`")
         return self.generatetoaddress(nblocks=nblocks, address=self.get_deterministic_priv_key().address, maxtries=maxtries)
 
+    def batch_results(self, requests):
+        """Send a batch of RPC requests and return their results in order.
+
+        Raises JSONRPCException for the first request that returned an error."""
+        results = []
+        for response in self.batch(requests):
+            error = response.get('error')
+            if error is not None:
+                # bitcoin-cli batches already hold the exception object
+                raise error if isinstance(error, JSONRPCException) else JSONRPCException(error)
+            results.append(response['result'])
+        return results
+
     def get_wallet_rpc(self, wallet_name):
         if self.use_cli:
             return RPCOverloadWrapper(self.cli("-rpcwallet={}".format(wallet_name)), True, self.descriptors)
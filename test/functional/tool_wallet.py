@@ -5,6 +5,7 @@
 """Test bitcoin-wallet."""
 
 import hashlib
+import mmap
 import os
 import stat
 import subprocess
@@ -15,7 +16,31 @@ from collections import OrderedDict
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import assert_equal
 
-BUFFER_SIZE = 16 * 1024
+DESCRIPTOR_WALLET_INFO = textwrap.dedent('''\
+    Wallet info
+    ===========
+    Name: %s
+    Format: sqlite
+    Descriptors: yes
+    Encrypted: no
+    HD (hd seed available): yes
+    Keypool Size: %d
+    Transactions: %d
+    Address Book: %d
+''')
+
+LEGACY_WALLET_INFO = textwrap.dedent('''\
+    Wallet info
+    ===========
+    Name: %s
+    Format: bdb
+    Descriptors: no
+    Encrypted: no
+    HD (hd seed available): yes
+    Keypool Size: %d
+    Transactions: %d
+    Address Book: %d
+''')
 
 
 class ToolWalletTest(BitcoinTestFramework):
@@ -29,38 +54,40 @@ class ToolWalletTest(BitcoinTestFramework):
         self.skip_if_no_wallet_tool()
 
     def bitcoin_wallet_process(self, *args):
-        binary = self.config["environment"]["BUILDDIR"] + '/src/bitcoin-wallet' + self.config["environment"]["EXEEXT"]
-        default_args = ['-datadir={}'.format(self.nodes[0].datadir), '-chain=%s' % self.chain]
+        default_args = self.wallet_tool_args
         if self.options.descriptors and 'create' in args:
-            default_args.append('-descriptors')
+            default_args = default_args + ['-descriptors']
 
-        return subprocess.Popen([binary] + default_args + list(args), stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        return subprocess.run(default_args + list(args), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
 
     def assert_raises_tool_error(self, error, *args):
         p = self.bitcoin_wallet_process(*args)
-        stdout, stderr = p.communicate()
-        assert_equal(p.poll(), 1)
-        assert_equal(stdout, '')
-        assert_equal(stderr.strip(), error)
+        assert_equal(p.returncode, 1)
+        assert_equal(p.stdout, '')
+        assert_equal(p.stderr.strip(), error)
 
     def assert_tool_output(self, output, *args):
         p = self.bitcoin_wallet_process(*args)
-        stdout, stderr = p.communicate()
-        assert_equal(stderr, '')
-        assert_equal(stdout, output)
-        assert_equal(p.poll(), 0)
+        assert_equal(p.stderr, '')
+        assert_equal(p.stdout, output)
+        assert_equal(p.returncode, 0)
 
     def wallet_shasum(self):
-        h = hashlib.sha1()
-        mv = memoryview(bytearray(BUFFER_SIZE))
-        with open(self.wallet_path, 'rb', buffering=0) as f:
-            for n in iter(lambda: f.readinto(mv), 0):
-                h.update(mv[:n])
-        return h.hexdigest()
+        with open(self.wallet_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest()
 
     def wallet_timestamp(self):
         return os.path.getmtime(self.wallet_path)
 
+    def wallet_shasum_and_timestamp(self, when):
+        shasum = self.wallet_shasum()
+        timestamp = self.wallet_timestamp()
+        self.log.debug('Wallet file timestamp {}: {}'.format(when, timestamp))
+        return shasum, timestamp
+
     def wallet_permissions(self):
         return oct(os.lstat(self.wallet_path).st_mode)[-3:]
 
@@ -72,31 +99,9 @@ class ToolWalletTest(BitcoinTestFramework):
         wallet_name = self.default_wallet_name if name == "" else name
         output_types = 3  # p2pkh, p2sh, segwit
         if self.options.descriptors:
-            return textwrap.dedent('''\
-                Wallet info
-                ===========
-                Name: %s
-                Format: sqlite
-                Descriptors: yes
-                Encrypted: no
-                HD (hd seed available): yes
-                Keypool Size: %d
-                Transactions: %d
-                Address Book: %d
-            ''' % (wallet_name, keypool * output_types, transactions, address))
+            return DESCRIPTOR_WALLET_INFO % (wallet_name, keypool * output_types, transactions, address)
         else:
-            return textwrap.dedent('''\
-                Wallet info
-                ===========
-                Name: %s
-                Format: bdb
-                Descriptors: no
-                Encrypted: no
-                HD (hd seed available): yes
-                Keypool Size: %d
-                Transactions: %d
-                Address Book: %d
-            ''' % (wallet_name, keypool, transactions, address * output_types))
+            return LEGACY_WALLET_INFO % (wallet_name, keypool, transactions, address * output_types)
 
     def read_dump(self, filename):
         dump = OrderedDict()
@@ -246,14 +251,10 @@ class ToolWalletTest(BitcoinTestFramework):
         self.stop_node(0)
 
         self.log.info('Calling wallet tool info after generating a transaction, testing output')
-        shasum_before = self.wallet_shasum()
-        timestamp_before = self.wallet_timestamp()
-        self.log.debug('Wallet file timestamp before calling info: {}'.format(timestamp_before))
+        shasum_before, timestamp_before = self.wallet_shasum_and_timestamp('before calling info')
         out = self.get_expected_info_output(transactions=1, address=1)
         self.assert_tool_output(out, '-wallet=' + self.default_wallet_name, 'info')
-        shasum_after = self.wallet_shasum()
-        timestamp_after = self.wallet_timestamp()
-        self.log.debug('Wallet file timestamp after calling info: {}'.format(timestamp_after))
+        shasum_after, timestamp_after = self.wallet_shasum_and_timestamp('after calling info')
         self.log_wallet_timestamp_comparison(timestamp_before, timestamp_after)
         #
         # TODO: Wallet tool info should not write to the wallet file.
@@ -264,14 +265,10 @@ class ToolWalletTest(BitcoinTestFramework):
 
     def test_tool_wallet_create_on_existing_wallet(self):
         self.log.info('Calling wallet tool create on an existing wallet, testing output')
-        shasum_before = self.wallet_shasum()
-        timestamp_before = self.wallet_timestamp()
-        self.log.debug('Wallet file timestamp before calling create: {}'.format(timestamp_before))
+        shasum_before, timestamp_before = self.wallet_shasum_and_timestamp('before calling create')
         out = "Topping up keypool...\n" + self.get_expected_info_output(name="foo", keypool=2000)
         self.assert_tool_output(out, '-wallet=foo', 'create')
-        shasum_after = self.wallet_shasum()
-        timestamp_after = self.wallet_timestamp()
-        self.log.debug('Wallet file timestamp after calling create: {}'.format(timestamp_after))
+        shasum_after, timestamp_after = self.wallet_shasum_and_timestamp('after calling create')
         self.log_wallet_timestamp_comparison(timestamp_before, timestamp_after)
         assert_equal(timestamp_before, timestamp_after)
         assert_equal(shasum_before, shasum_after)
@@ -282,15 +279,11 @@ class ToolWalletTest(BitcoinTestFramework):
         self.start_node(0, ['-nowallet', '-wallet=foo'])
 
         self.log.info('Calling getwalletinfo on a different wallet ("foo"), testing output')
-        shasum_before = self.wallet_shasum()
-        timestamp_before = self.wallet_timestamp()
-        self.log.debug('Wallet file timestamp before calling getwalletinfo: {}'.format(timestamp_before))
+        shasum_before, timestamp_before = self.wallet_shasum_and_timestamp('before calling getwalletinfo')
         out = self.nodes[0].getwalletinfo()
         self.stop_node(0)
 
-        shasum_after = self.wallet_shasum()
-        timestamp_after = self.wallet_timestamp()
-        self.log.debug('Wallet file timestamp after calling getwalletinfo: {}'.format(timestamp_after))
+        shasum_after, timestamp_after = self.wallet_shasum_and_timestamp('after calling getwalletinfo')
 
         assert_equal(0, out['txcount'])
         if not self.options.descriptors:
@@ -394,6 +387,8 @@ class ToolWalletTest(BitcoinTestFramework):
 
 
     def run_test(self):
+        binary = self.config["environment"]["BUILDDIR"] + '/src/bitcoin-wallet' + self.config["environment"]["EXEEXT"]
+        self.wallet_tool_args = [binary, '-datadir={}'.format(self.nodes[0].datadir), '-chain=%s' % self.chain]
         self.wallet_path = os.path.join(self.nodes[0].datadir, self.chain, 'wallets', self.default_wallet_name, self.wallet_data_filename)
         self.test_invalid_tool_commands_and_args()
         # Warning: The following tests are order-dependent.
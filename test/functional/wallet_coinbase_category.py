@@ -7,6 +7,7 @@
 Tests listtransactions, listsinceblock, and gettransaction.
 """
 
+from test_framework.address import ADDRESS_BCRT1_UNSPENDABLE
 from test_framework.test_framework import BitcoinTestFramework
 from test_framework.util import (
     assert_array_result
@@ -19,14 +20,21 @@ class CoinbaseCategoryTest(BitcoinTestFramework):
     def skip_test_if_missing_module(self):
         self.skip_if_no_wallet()
 
-    def assert_category(self, category, address, txid, skip):
-        assert_array_result(self.nodes[0].listtransactions(skip=skip),
+    def assert_category(self, category, address, txid):
+        node = self.nodes[0]
+        # Fetch the three views of the wallet in a single batch request
+        listtransactions, listsinceblock, gettransaction = node.batch_results([
+            node.listtransactions.get_request(),
+            node.listsinceblock.get_request(),
+            node.gettransaction.get_request(txid),
+        ])
+        assert_array_result(listtransactions,
                             {"address": address},
                             {"category": category})
-        assert_array_result(self.nodes[0].listsinceblock()["transactions"],
+        assert_array_result(listsinceblock["transactions"],
                             {"address": address},
                             {"category": category})
-        assert_array_result(self.nodes[0].gettransaction(txid)["details"],
+        assert_array_result(gettransaction["details"],
                             {"address": address},
                             {"category": category})
 
@@ -38,22 +46,23 @@ class CoinbaseCategoryTest(BitcoinTestFramework):
         txid = self.nodes[0].getblock(hash)["tx"][0]
 
         # Coinbase transaction is immature after 1 confirmation
-        self.assert_category("immature", address, txid, 0)
+        self.assert_category("immature", address, txid)
 
-        # Mine another 99 blocks on top
-        self.nodes[0].generate(99)
+        # Mine another 99 blocks on top, to an address outside the wallet so that
+        # the wallet doesn't track their coinbases and ours stays its latest tx
+        self.nodes[0].generatetoaddress(99, ADDRESS_BCRT1_UNSPENDABLE)
         # Coinbase transaction is still immature after 100 confirmations
-        self.assert_category("immature", address, txid, 99)
+        self.assert_category("immature", address, txid)
 
         # Mine one more block
-        self.nodes[0].generate(1)
+        self.nodes[0].generatetoaddress(1, ADDRESS_BCRT1_UNSPENDABLE)
         # Coinbase transaction is now matured, so category is "generate"
-        self.assert_category("generate", address, txid, 100)
+        self.assert_category("generate", address, txid)
 
         # Orphan block that paid to address
         self.nodes[0].invalidateblock(hash)
         # Coinbase transaction is now orphaned
-        self.assert_category("orphan", address, txid, 100)
+        self.assert_category("orphan", address, txid)
 
 if __name__ == '__main__':
     CoinbaseCategoryTest().main()
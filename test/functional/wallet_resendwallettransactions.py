@@ -36,9 +36,6 @@ class ResendWalletTransactionsTest(BitcoinTestFramework):
         # Can take a few seconds due to transaction trickling
         peer_first.wait_for_broadcast([txid])
 
-        # Add a second peer since txs aren't rebroadcast to the same peer (see filterInventoryKnown)
-        peer_second = node.add_p2p_connection(P2PTxInvStore())
-
         self.log.info("Create a block")
         # Create and submit a block without the transaction.
         # Transactions are only rebroadcast if there has been a block at least five minutes
@@ -50,6 +47,9 @@ class ResendWalletTransactionsTest(BitcoinTestFramework):
         block.solve()
         node.submitblock(ToHex(block))
 
+        # Add a second peer since txs aren't rebroadcast to the same peer (see filterInventoryKnown)
+        peer_second = node.add_p2p_connection(P2PTxInvStore())
+
         # Set correct m_best_block_time, which is used in ResendWalletTransactions
         node.syncwithvalidationinterfacequeue()
         now = int(time.time())